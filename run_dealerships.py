@@ -1,8 +1,24 @@
 import os
 import csv
+import argparse
+import atexit
 import time
+import queue
+import shutil
+import socket
+import tempfile
 import logging
-from typing import List, Tuple
+import logging.handlers
+import threading
+import json
+import http.client
+import urllib.request
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, count, islice
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -11,36 +27,180 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s: %(message)s',
-    handlers=[
+# Libraries whose own DEBUG/INFO output (every WebDriver command, HTTP
+# request, ...) would drown out this script's logs
+QUIET_LOGGERS = ['selenium', 'urllib3', 'openai', 'httpx', 'httpcore']
+
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Configure logging so worker threads only enqueue records
+    
+    File and console output happen on a background listener thread,
+    which is stopped (flushing pending records) at interpreter exit.
+    
+    :param level: Root log level; per-step breadcrumbs are logged at DEBUG
+    :return: The running QueueListener
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s: %(message)s')
+    handlers = [
         logging.FileHandler('neosemo_processing.log'),
         logging.StreamHandler()
     ]
-)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # The queue handler only renders the message; timestamps and levels are
+    # added by the listener's handlers
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(
+        level=level,
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
 
 # Optional AI processing (if API key is available)
 try:
-    from langchain_openai import ChatOpenAI
-    from langchain_core.prompts import ChatPromptTemplate
-    from langchain_core.output_parsers import StrOutputParser
+    from openai import OpenAI
     AI_AVAILABLE = True
 except ImportError:
     AI_AVAILABLE = False
 
+# Optional public-suffix aware domain parsing. The extractor only uses the
+# suffix list bundled with tldextract, so lookups never go to the network.
+try:
+    import tldextract
+    TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=())
+except ImportError:
+    TLD_EXTRACT = None
+
+NEOSEMO_URL = "https://neosemo.ai/"
+
+# chromedriver on PATH if present; otherwise Selenium Manager (Selenium 4.11+)
+# resolves and caches a matching driver on first use
+CHROMEDRIVER_PATH = shutil.which("chromedriver")
+
+# Email address the audit reports are requested for
+REPORT_EMAIL = "JOSH@PROJECTXLABS.AI"
+
+# Neosemo's form is normally driven through the browser. If the JSON endpoint
+# behind it is known (NEOSEMO_API_URL), audits are requested directly and the
+# browser is only used as a fallback. The endpoint must accept
+# {"url": ..., "email": ...} and answer with the report URL in API_REPORT_FIELD.
+API_REPORT_FIELD = "reportUrl"
+API_TIMEOUT = 15
+
+# Resources not needed to submit the audit form, blocked via CDP
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics*", "*googletagmanager*", "*facebook*", "*hotjar*",
+]
+
+# Stylesheets can affect element visibility, so blocking them is opt-in
+BLOCKED_STYLESHEET_PATTERNS = ["*.css"]
+
+# Explicit wait settings shared by every step of process_url; the form
+# responds quickly, so poll well below Selenium's 0.5s default
+WAIT_TIMEOUT = 10
+WAIT_POLL_FREQUENCY = 0.1
+
+# Short grace period for the optional popup's close button to become clickable
+POPUP_TIMEOUT = 1
+POPUP_POLL_FREQUENCY = 0.1
+
+# Attempts per URL and exponential backoff bounds (seconds) between them
+MAX_ATTEMPTS = 3
+RETRY_MIN_DELAY = 1
+RETRY_MAX_DELAY = 10
+
+# Number of Chrome instances processing URLs in parallel
+DEFAULT_WORKERS = 4
+
+# Columns of the output CSV (written without a header row)
+OUTPUT_FIELDS = ['url', 'audit_report_url']
+
+# URLs read from the input CSV and analyzed together per batch
+URL_BATCH_SIZE = 50
+
+NO_AI_INSIGHTS = "No AI insights available"
+
+# URL analysis prompt, built once; each call only appends the domain
+AI_MODEL = "gpt-3.5-turbo"
+AI_TEMPERATURE = 0.7
+URL_ANALYSIS_MESSAGES = [
+    {
+        "role": "system",
+        "content": (
+            "You are an expert in analyzing dealership websites.\n"
+            "Given a dealership URL, provide a brief, professional assessment "
+            "of what you can infer about the dealership:\n"
+            "- Likely type of dealership (brand, multi-brand, etc.)\n"
+            "- Potential location or region\n"
+            "- Any notable observations from the URL\n"
+            "\n"
+            "Be concise but insightful."
+        )
+    }
+]
+
+# Number of concurrent LLM requests when batching AI analyses
+AI_MAX_CONCURRENCY = 20
+
+def registered_domain(url: str) -> str:
+    """
+    Reduce a URL to the domain its AI analysis depends on
+    
+    :param url: Dealership website URL, with or without scheme
+    :return: Lowercased registered domain (e.g. "holmauto.com")
+    """
+    url = url.strip().lower()
+    if TLD_EXTRACT:
+        # Built from domain and suffix rather than the registered_domain
+        # property, which newer tldextract releases deprecate
+        parts = TLD_EXTRACT(url)
+        if parts.domain and parts.suffix:
+            return f"{parts.domain}.{parts.suffix}"
+    host = urlsplit(url if '://' in url else f"//{url}").hostname or url
+    return host[4:] if host.startswith('www.') else host
+
 class NeosemoAuditProcessor:
-    def __init__(self, openai_api_key: str = None):
+    def __init__(self, openai_api_key: str = None, workers: int = DEFAULT_WORKERS,
+                 block_stylesheets: bool = False, api_url: str = None):
         """
         Initialize Neosemo Audit Processor
         
         :param openai_api_key: Optional OpenAI API key for AI assistance
+        :param workers: Number of parallel WebDriver instances
+        :param block_stylesheets: Also block CSS requests in the browser
+        :param api_url: Optional Neosemo audit endpoint to try before the browser
         """
-        self.driver = None
-        self.ai_assistant = None
+        self.workers = max(1, workers)
+        self.block_stylesheets = block_stylesheets
+        self.api_url = api_url
+        self.ai_client = None
+        
+        # WebDriver instances are not thread-safe, so each worker thread
+        # borrows one (with its cached WebDriverWait) from the pool and
+        # keeps it in thread-local state. Drivers are only started once a
+        # URL actually needs the browser.
+        self._local = threading.local()
+        self._pool = queue.Queue()
+        self._worker_ids = count()
+        self._worker_ids_lock = threading.Lock()
+        self._profile_dirs: Dict[object, str] = {}
+        
+        # Resolve Neosemo once so browsers skip the DNS lookup on every load
+        self.neosemo_ip = self.resolve_host(urlsplit(NEOSEMO_URL).hostname)
+        
+        # AI analyses depend on the domain only, so identical domains share one LLM call
+        self._domain_insights: Dict[str, str] = {}
         
         # Try to set up AI if key is provided and libraries are available
         if AI_AVAILABLE and openai_api_key:
@@ -48,7 +208,13 @@ class NeosemoAuditProcessor:
                 self.setup_ai_assistant(openai_api_key)
             except Exception as e:
                 logging.warning(f"Could not set up AI assistant: {e}")
-                self.ai_assistant = None
+                self.ai_client = None
+        
+        # Whether AI is usable is decided once here, not on every URL
+        self._analyze_fn = (
+            self.request_analysis if self.ai_client
+            else lambda _: NO_AI_INSIGHTS
+        )
     
     def setup_ai_assistant(self, openai_api_key: str):
         """
@@ -56,30 +222,23 @@ class NeosemoAuditProcessor:
         
         :param openai_api_key: OpenAI API key
         """
-        llm = ChatOpenAI(
-            model="gpt-3.5-turbo", 
-            temperature=0.7, 
-            api_key=openai_api_key
-        )
-        
-        # Prompt template for URL analysis
-        url_analysis_prompt = ChatPromptTemplate.from_template(
-            """You are an expert in analyzing dealership websites. 
-            Given a dealership URL: {url}
-            Provide a brief, professional assessment of what you can infer about the dealership:
-            - Likely type of dealership (brand, multi-brand, etc.)
-            - Potential location or region
-            - Any notable observations from the URL
-            
-            Be concise but insightful."""
-        )
+        self.ai_client = OpenAI(api_key=openai_api_key)
+    
+    def request_analysis(self, domain: str) -> str:
+        """
+        Ask the model for an assessment of a dealership domain
         
-        # Create analysis chain
-        self.analyze_url_chain = (
-            url_analysis_prompt 
-            | llm 
-            | StrOutputParser()
+        :param domain: Registered domain of a dealership website
+        :return: Insights about the domain
+        """
+        response = self.ai_client.chat.completions.create(
+            model=AI_MODEL,
+            messages=URL_ANALYSIS_MESSAGES + [
+                {"role": "user", "content": f"Dealership URL: {domain}"}
+            ],
+            temperature=AI_TEMPERATURE
         )
+        return response.choices[0].message.content or ''
     
     def analyze_url(self, url: str) -> str:
         """
@@ -88,145 +247,479 @@ class NeosemoAuditProcessor:
         :param url: Dealership website URL
         :return: Insights about the URL
         """
-        if self.ai_assistant and hasattr(self, 'analyze_url_chain'):
+        domain = registered_domain(url)
+        if domain not in self._domain_insights:
             try:
-                return self.analyze_url_chain.invoke({"url": url})
+                self._domain_insights[domain] = self._analyze_fn(domain)
             except Exception as e:
                 logging.warning(f"AI analysis failed for {url}: {e}")
-        return "No AI insights available"
+                return NO_AI_INSIGHTS
+        return self._domain_insights[domain]
+    
+    def analyze_urls(self, urls: List[str]) -> List[str]:
+        """
+        Analyze many URLs concurrently using AI if available
+        
+        :param urls: Dealership website URLs
+        :return: Insights for each URL, in input order
+        """
+        if not self.ai_client:
+            return [NO_AI_INSIGHTS] * len(urls)
+        
+        domains = [registered_domain(url) for url in urls]
+        pending = list(dict.fromkeys(
+            domain for domain in domains if domain not in self._domain_insights
+        ))
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(AI_MAX_CONCURRENCY, len(pending))) as executor:
+                futures = {
+                    domain: executor.submit(self._analyze_fn, domain)
+                    for domain in pending
+                }
+            for domain, future in futures.items():
+                try:
+                    self._domain_insights[domain] = future.result()
+                except Exception as e:
+                    logging.warning(f"AI analysis failed for {domain}: {e}")
+        return [
+            self._domain_insights.get(domain, NO_AI_INSIGHTS)
+            for domain in domains
+        ]
+    
+    @staticmethod
+    def resolve_host(host: str) -> Optional[str]:
+        """
+        Look up the IPv4 address of a host
+        
+        :param host: Hostname to resolve
+        :return: IP address, or None if resolution failed
+        """
+        try:
+            return socket.getaddrinfo(host, 443, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+        except (OSError, IndexError) as e:
+            logging.warning(f"Could not resolve {host}: {e}")
+            return None
+    
+    @property
+    def driver(self):
+        """WebDriver currently owned by the calling worker thread."""
+        return getattr(self._local, 'driver', None)
     
-    def setup_driver(self):
-        """Set up and return a Chrome WebDriver instance."""
+    @property
+    def wait(self):
+        """WebDriverWait bound to the calling worker thread's WebDriver."""
+        return getattr(self._local, 'wait', None)
+    
+    def setup_driver(self, worker_id: int = 0):
+        """
+        Set up and return a Chrome WebDriver instance
+        
+        :param worker_id: Pool slot, used to name the driver's profile directory
+        """
         chrome_options = Options()
-        # Optional: Add headless mode if you want the browser to run in background
-        # chrome_options.add_argument("--headless")
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        # Fresh profile per driver: its disk cache serves JS/CSS bundles on later
+        # loads within the run, while concurrent runs never share a profile and
+        # no cookies or form state carry over between runs
+        profile_dir = tempfile.mkdtemp(prefix=f"neosemo-profile-{worker_id}-")
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-extensions")
+        # Images aren't needed to submit the form
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        if self.neosemo_ip:
+            host = urlsplit(NEOSEMO_URL).hostname
+            chrome_options.add_argument(f"--host-resolver-rules=MAP {host} {self.neosemo_ip}")
+        # Return from driver.get() at DOMContentLoaded; explicit waits handle the rest
+        chrome_options.page_load_strategy = 'eager'
+        service = Service(CHROMEDRIVER_PATH)
+        try:
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        except Exception:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            raise
+        self._profile_dirs[driver] = profile_dir
+        self.block_resources(driver)
+        return driver
+    
+    def quit_driver(self, driver):
+        """
+        Quit a WebDriver and remove its profile directory
+        
+        :param driver: Chrome WebDriver instance
+        """
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logging.warning(f"Failed to quit WebDriver: {e}")
+        profile_dir = self._profile_dirs.pop(driver, None)
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+    
+    def block_resources(self, driver):
+        """
+        Drop requests for images, fonts and trackers via the DevTools protocol
+        
+        :param driver: Chrome WebDriver instance
+        """
+        blocked_urls = list(BLOCKED_URL_PATTERNS)
+        if self.block_stylesheets:
+            blocked_urls += BLOCKED_STYLESHEET_PATTERNS
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+        except WebDriverException as e:
+            logging.warning(f"Could not enable resource blocking: {e}")
     
-    def process_url(self, url: str) -> Tuple[str, str]:
+    @contextmanager
+    def borrow_driver(self):
+        """
+        Give the calling thread exclusive use of a pooled WebDriver
+        
+        A new WebDriver (and its WebDriverWait) is started when the pool is
+        empty; with one borrow per worker thread at most `workers` exist.
+        A driver discarded while borrowed is not returned to the pool.
+        """
+        try:
+            driver, wait = self._pool.get_nowait()
+        except queue.Empty:
+            driver, wait = self._start_driver()
+        self._local.driver, self._local.wait = driver, wait
+        try:
+            yield driver
+        finally:
+            driver, wait = self._local.driver, self._local.wait
+            self._local.driver, self._local.wait = None, None
+            if driver is not None:
+                self._pool.put((driver, wait))
+    
+    def _start_driver(self) -> Tuple[object, WebDriverWait]:
+        """Start a new WebDriver together with its cached WebDriverWait."""
+        with self._worker_ids_lock:
+            worker_id = next(self._worker_ids)
+        driver = self.setup_driver(worker_id)
+        return driver, WebDriverWait(driver, WAIT_TIMEOUT, poll_frequency=WAIT_POLL_FREQUENCY)
+    
+    def discard_driver(self):
+        """Quit the calling thread's WebDriver so it is never returned to the pool."""
+        if self.driver is not None:
+            self.quit_driver(self.driver)
+        self._local.driver, self._local.wait = None, None
+    
+    def teardown_driver_pool(self):
+        """Quit every WebDriver in the pool."""
+        while not self._pool.empty():
+            driver, _ = self._pool.get_nowait()
+            self.quit_driver(driver)
+    
+    def load_homepage(self):
+        """Navigate to the Neosemo homepage, reusing the previous page when possible."""
+        current_url = self.driver.current_url
+        if current_url.startswith(NEOSEMO_URL) and current_url != NEOSEMO_URL:
+            # Going back from a report page skips a full reload of the homepage,
+            # as long as the form isn't left on the email step
+            self.driver.back()
+            email_inputs = self.driver.find_elements(By.CSS_SELECTOR, "input#email")
+            if (self.driver.current_url == NEOSEMO_URL
+                    and not any(e.is_displayed() for e in email_inputs)):
+                return
+        self.driver.get(NEOSEMO_URL)
+    
+    def submit_api(self, url: str) -> str:
+        """
+        Request an audit directly from the Neosemo endpoint, skipping the browser
+        
+        :param url: Dealership URL to process
+        :return: Audit report URL, or '' if the request failed
+        """
+        request = urllib.request.Request(
+            self.api_url,
+            data=json.dumps({"url": url, "email": REPORT_EMAIL}).encode('utf-8'),
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+            method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=API_TIMEOUT) as response:
+                audit_report_url = json.load(response).get(API_REPORT_FIELD)
+        except (OSError, http.client.HTTPException, ValueError, AttributeError) as e:
+            logging.warning(f"API submission failed for {url}: {e}")
+            return ''
+        if not isinstance(audit_report_url, str) or not audit_report_url:
+            logging.warning(f"API returned no usable {API_REPORT_FIELD} for {url}: {audit_report_url!r}")
+            return ''
+        return audit_report_url
+    
+    def process_url(self, url: str, url_insights: Optional[str] = None) -> Tuple[str, str]:
         """
         Process a single URL on the Neosemo.ai website
         
+        The audit is requested through the API when one is configured, falling
+        back to the browser. Transient Selenium failures while filling in the
+        form are retried with exponential backoff; once the final submit has
+        been clicked nothing is retried, so an audit is never requested twice.
+        
         :param url: Dealership URL to process
+        :param url_insights: Pre-computed AI insights; analyzed on demand if omitted
         :return: Tuple of (original URL, audit report URL)
         """
         try:
             # AI-powered URL analysis (if available)
-            url_insights = self.analyze_url(url)
+            if url_insights is None:
+                url_insights = self.analyze_url(url)
             logging.info(f"URL Insights for {url}:\n{url_insights}")
             
-            # Selenium processing
-            self.driver.get("https://neosemo.ai/")
-            time.sleep(2)
-            
-            # Fill URL
-            try:
-                url_input = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='text']"))
-                )
-                url_input.clear()
-                url_input.send_keys(url)
-                logging.info(f"URL entered: {url}")
-            except (TimeoutException, NoSuchElementException) as e:
-                logging.error(f"Failed to enter URL {url}: {e}")
-                return url, ''
-            
-            # Submit URL
-            try:
-                submit_button = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
-                )
-                submit_button.click()
-                logging.info("URL submitted")
-            except (TimeoutException, NoSuchElementException) as e:
-                logging.error(f"Failed to submit URL {url}: {e}")
-                return url, ''
-            
-            # Handle email
-            try:
-                email_input = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input#email"))
-                )
-                email_input.send_keys("JOSH@PROJECTXLABS.AI")
-                logging.info("Email entered")
-            except (TimeoutException, NoSuchElementException) as e:
-                logging.error(f"Failed to enter email for {url}: {e}")
-                return url, ''
-            
-            # Final submit
-            try:
-                final_submit = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[text()='Submit']"))
-                )
-                final_submit.click()
-                logging.info("Form submitted")
-            except (TimeoutException, NoSuchElementException) as e:
-                logging.error(f"Failed to submit form for {url}: {e}")
-                return url, ''
+            if self.api_url:
+                audit_report_url = self.submit_api(url)
+                if audit_report_url:
+                    logging.info(f"Audit Report URL: {audit_report_url}")
+                    return url, audit_report_url
+                logging.info(f"Falling back to the browser for {url}")
             
-            # Handle popup
-            time.sleep(5)
+            with self.borrow_driver():
+                start_url = None
+                for attempt in range(1, MAX_ATTEMPTS + 1):
+                    try:
+                        start_url = self._submit_form(url)
+                        break
+                    except (TimeoutException, WebDriverException) as e:
+                        if attempt == MAX_ATTEMPTS:
+                            logging.error(f"Giving up on {url} after {attempt} attempts: {e}")
+                            # Anything other than a wait timing out may mean the
+                            # browser itself is broken; don't hand it to the next URL
+                            if not isinstance(e, TimeoutException):
+                                self.discard_driver()
+                            return url, ''
+                        delay = min(RETRY_MAX_DELAY, RETRY_MIN_DELAY * 2 ** (attempt - 1))
+                        logging.warning(f"Attempt {attempt} failed for {url}, retrying in {delay}s: {e}")
+                        time.sleep(delay)
+                        self.reset_driver()
+                
+                # The audit has been requested at this point, so a failure to
+                # read the report URL is final; retrying would submit it again
+                try:
+                    return url, self._read_report_url(url, start_url)
+                except (TimeoutException, WebDriverException) as e:
+                    logging.error(f"Audit submitted for {url} but no report URL was read: {e}")
+                    if not isinstance(e, TimeoutException):
+                        self.discard_driver()
+                    return url, ''
+        
+        except Exception as e:
+            logging.error(f"Unexpected error processing {url}: {e}")
+            return url, ''
+    
+    def reset_driver(self):
+        """
+        Leave any half-submitted form behind before retrying a URL
+        
+        If the WebDriver no longer responds (e.g. Chrome crashed), it is
+        replaced with a new one for the calling thread.
+        """
+        try:
+            self.driver.get("about:blank")
+        except WebDriverException as e:
+            logging.warning(f"WebDriver unusable, starting a new one: {e}")
+            self.discard_driver()
+            self._local.driver, self._local.wait = self._start_driver()
+    
+    def _submit_form(self, url: str) -> str:
+        """
+        Submit a single URL through the Neosemo.ai form once
+        
+        Failures here happen before the audit is requested and are safe to retry.
+        Each step re-raises with its name in the message and leaves logging to
+        the caller.
+        
+        :param url: Dealership URL to process
+        :return: URL of the form page the final submit was clicked on
+        :raises TimeoutException: If a form step does not become ready in time
+        :raises WebDriverException: On other browser failures
+        """
+        # Selenium processing
+        self.load_homepage()
+        
+        # Fill URL
+        try:
+            url_input = self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='text']"))
+            )
+            url_input.clear()
+            url_input.send_keys(url)
+            logging.debug(f"URL entered: {url}")
+        except (TimeoutException, NoSuchElementException) as e:
+            raise type(e)(f"Failed to enter URL: {e.msg or 'timed out'}") from e
+        
+        # Submit URL
+        try:
+            submit_button = self.wait.until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
+            )
+            submit_button.click()
+            logging.debug("URL submitted")
+        except (TimeoutException, NoSuchElementException) as e:
+            raise type(e)(f"Failed to submit URL: {e.msg or 'timed out'}") from e
+        
+        # Handle email
+        try:
+            email_input = self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "input#email"))
+            )
+            email_input.send_keys(REPORT_EMAIL)
+            logging.debug("Email entered")
+        except (TimeoutException, NoSuchElementException) as e:
+            raise type(e)(f"Failed to enter email: {e.msg or 'timed out'}") from e
+        
+        # Final submit
+        start_url = self.driver.current_url
+        try:
+            final_submit = self.wait.until(
+                EC.element_to_be_clickable((By.XPATH, "//button[text()='Submit']"))
+            )
+            final_submit.click()
+            logging.debug("Form submitted")
+        except (TimeoutException, NoSuchElementException) as e:
+            raise type(e)(f"Failed to submit form: {e.msg or 'timed out'}") from e
+        return start_url
+    
+    def _read_report_url(self, url: str, start_url: str) -> str:
+        """
+        Wait for the browser to leave the submitted form and read the report URL
+        
+        :param url: Dealership URL being processed
+        :param start_url: URL of the form page the final submit was clicked on
+        :return: Audit report URL
+        :raises TimeoutException: If the report page does not load in time
+        :raises WebDriverException: On other browser failures
+        """
+        # Return as soon as the browser navigates to the report (or the popup shows);
+        # still being on the form page means there is no report URL to read
+        try:
+            self.wait.until(EC.any_of(
+                EC.url_changes(start_url),
+                EC.presence_of_element_located((By.ID, "cta_178493"))
+            ))
+            # The popup element may already be in the DOM before navigating
+            # (e.g. on a page restored by back()), so insist on the URL change
+            if self.driver.current_url == start_url:
+                self.wait.until(EC.url_changes(start_url))
+        except TimeoutException as e:
+            raise type(e)(f"Report page did not load in time: {e.msg or 'timed out'}") from e
+        
+        # Handle popup (optional): find_elements returns immediately when absent
+        popups = self.driver.find_elements(By.ID, "cta_178493")
+        if popups:
             try:
-                popup_close = WebDriverWait(self.driver, 3).until(
-                    EC.element_to_be_clickable((By.XPATH, "//*[@id='cta_178493']/div/div[2]"))
+                popup_close = WebDriverWait(
+                    self.driver, POPUP_TIMEOUT, poll_frequency=POPUP_POLL_FREQUENCY
+                ).until(
+                    EC.element_to_be_clickable(
+                        (By.CSS_SELECTOR, "#cta_178493 > div > div:nth-of-type(2)")
+                    )
                 )
                 popup_close.click()
-                logging.info("Popup closed")
+                logging.debug("Popup closed")
             except (TimeoutException, NoSuchElementException):
-                logging.info("No popup detected")
-            
-            # Get current URL (audit report URL)
-            audit_report_url = self.driver.current_url
-            logging.info(f"Audit Report URL: {audit_report_url}")
-            return url, audit_report_url
+                logging.info("Popup could not be closed")
+        else:
+            logging.debug("No popup detected")
         
-        except Exception as e:
-            logging.error(f"Unexpected error processing {url}: {e}")
-            return url, ''
+        # Get current URL (audit report URL)
+        audit_report_url = self.driver.current_url
+        logging.info(f"Audit Report URL: {audit_report_url}")
+        return audit_report_url
     
-    def process_urls(self, input_file: str, output_file: str):
+    def load_completed_results(self, output_file: str) -> Dict[str, str]:
+        """
+        Read audit report URLs already written by a previous run
+        
+        :param output_file: Path to output CSV with audit report URLs
+        :return: Mapping of URL to audit report URL for successful rows
+        """
+        if not os.path.exists(output_file):
+            return {}
+        with open(output_file, 'r', newline='', encoding='utf-8') as csvfile:
+            reader = csv.DictReader(csvfile, fieldnames=OUTPUT_FIELDS)
+            return {
+                row['url']: row['audit_report_url']
+                for row in reader
+                if row['url'] and row['audit_report_url']
+            }
+    
+    def process_urls(self, input_file: str, output_file: str, resume: bool = False):
         """
         Process URLs from input CSV and generate audit reports
         
+        Results are written as soon as each URL finishes. When resuming, the
+        output file is appended to rather than replaced, and URLs that already
+        have an audit report in it are not re-processed; a later row for a URL
+        supersedes an earlier failed one.
+        
         :param input_file: Path to input CSV with URLs
         :param output_file: Path to output CSV with audit report URLs
+        :param resume: Continue a previous run recorded in output_file
         """
-        # Setup WebDriver
-        self.setup_driver()
+        completed = self.load_completed_results(output_file) if resume else {}
+        
+        successful = 0
+        resumed = 0
+        failed = []
         
         try:
-            # Read URLs from input CSV
-            with open(input_file, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.reader(csvfile)
-                urls = [row[0] for row in reader]
-            
-            # Prepare output data
-            output_data = []
-            successful = []
-            failed = []
-            
-            # Process each URL
-            for url in urls:
-                result_url, audit_report_url = self.process_url(url)
+            with open(input_file, 'r', newline='', encoding='utf-8') as infile, \
+                    open(output_file, 'a' if resume else 'w', newline='', encoding='utf-8') as outfile:
+                reader = csv.reader(infile)
+                writer = csv.DictWriter(outfile, fieldnames=OUTPUT_FIELDS)
+                urls = (row[0] for row in reader if row)
                 
-                if audit_report_url:
-                    output_data.append([result_url, audit_report_url])
-                    successful.append(result_url)
-                else:
-                    output_data.append([result_url, ''])
-                    failed.append(result_url)
+                # Batches are read and analyzed one step ahead of the browser
+                # work, and a batch's URLs are queued before the previous
+                # batch's results are drained, so neither the LLM calls nor the
+                # workers wait at batch boundaries
+                batches = chain(iter(lambda: list(islice(urls, URL_BATCH_SIZE)), []), [None])
+                in_flight = deque()
+                previous = None
                 
-                time.sleep(2)  # Pause between processing
-            
-            # Write results to output CSV
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerows(output_data)
+                with ThreadPoolExecutor(max_workers=self.workers) as executor, \
+                        ThreadPoolExecutor(max_workers=1) as ai_executor:
+                    for batch in batches:
+                        upcoming = None
+                        if batch is not None:
+                            # Skip URLs whose reports are already in the output file
+                            pending = [url for url in batch if url not in completed]
+                            resumed += len(batch) - len(pending)
+                            upcoming = (pending, ai_executor.submit(self.analyze_urls, pending))
+                        
+                        # Process URLs in parallel, one WebDriver per worker
+                        keep = 0
+                        if previous is not None:
+                            pending, insights = previous
+                            in_flight.extend(
+                                executor.submit(self.process_url, url, url_insights)
+                                for url, url_insights in zip(pending, insights.result())
+                            )
+                            keep = len(pending) if batch is not None else 0
+                        
+                        # Write results in input order as they finish
+                        while len(in_flight) > keep:
+                            result_url, audit_report_url = in_flight.popleft().result()
+                            writer.writerow({'url': result_url, 'audit_report_url': audit_report_url})
+                            outfile.flush()
+                            
+                            if audit_report_url:
+                                successful += 1
+                            else:
+                                failed.append(result_url)
+                        
+                        previous = upcoming
             
             # Print and log summary
             summary_message = f"""
 --- Processing Complete ---
-Successfully processed: {len(successful)} URLs
+Successfully processed: {successful} URLs
+Already processed (skipped): {resumed} URLs
 Failed to process: {len(failed)} URLs
 """
             logging.info(summary_message)
@@ -238,24 +731,62 @@ Failed to process: {len(failed)} URLs
                     logging.info(f"- {url}")
         
         finally:
-            # Always ensure driver is closed
-            if self.driver:
-                self.driver.quit()
+            # Always ensure drivers are closed
+            self.teardown_driver_pool()
+
+def positive_int(value: str) -> int:
+    """
+    argparse type for counts that must be at least 1
+    
+    :param value: Command-line (or environment default) value
+    :return: The parsed integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value!r}")
+    return number
 
 def main():
-    # Get OpenAI API key from .env file
+    # Load .env first so its values can serve as option defaults
     from dotenv import load_dotenv
     load_dotenv()
     
-    input_file = 'dealer_urls.csv'
-    output_file = 'dealer_urls_with_reports.csv'
+    parser = argparse.ArgumentParser(description="Request Neosemo audit reports for dealership URLs")
+    parser.add_argument('input_file', nargs='?', default='dealer_urls.csv',
+                        help="CSV with one dealership URL per row")
+    parser.add_argument('output_file', nargs='?', default='dealer_urls_with_reports.csv',
+                        help="CSV to write URL, audit report URL rows to")
+    parser.add_argument('--resume', action='store_true',
+                        help="Append to output_file, skipping URLs that already have a report")
+    parser.add_argument('--workers', type=positive_int,
+                        default=os.getenv('NEOSEMO_WORKERS', DEFAULT_WORKERS),
+                        help="Number of parallel browsers (env: NEOSEMO_WORKERS, default: %(default)s)")
+    parser.add_argument('--block-css', action='store_true',
+                        default=os.getenv('NEOSEMO_BLOCK_CSS', '').lower() in ('1', 'true', 'yes'),
+                        help="Also block stylesheets in the browser (env: NEOSEMO_BLOCK_CSS)")
+    parser.add_argument('--api-url', default=os.getenv('NEOSEMO_API_URL'),
+                        help="Neosemo audit endpoint to try before the browser (env: NEOSEMO_API_URL)")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Log every form step (DEBUG level)")
+    args = parser.parse_args()
+    
+    # Configure logging
+    setup_logging(logging.DEBUG if args.verbose else logging.INFO)
     
     # Get API key, pass None if not set
     openai_api_key = os.getenv('OPENAI_API_KEY')
     
     # Create processor with optional API key
-    processor = NeosemoAuditProcessor(openai_api_key)
-    processor.process_urls(input_file, output_file)
+    processor = NeosemoAuditProcessor(
+        openai_api_key,
+        workers=args.workers,
+        block_stylesheets=args.block_css,
+        api_url=args.api_url
+    )
+    processor.process_urls(args.input_file, args.output_file, resume=args.resume)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file